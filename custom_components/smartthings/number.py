@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 # import asyncio
-from collections import namedtuple
 from collections.abc import Sequence
 import logging
 from typing import Literal
@@ -23,16 +22,23 @@ UNITS = {
     "F": UnitOfTemperature.FAHRENHEIT,
 }
 
-Map = namedtuple(  # noqa: PYI024
-    "map",
-    "attribute command name unit_of_measurement icon min_value max_value step mode",
-)
+# Max and min are hardcoded for Family Hub Fridge/Freezer because the actual ranges are stored in
+# a separate capability called custom.thermostatSetpointControl instead of where they should be
+# under temperatureMeasurement -> range
+FRIDGE_RANGES = {
+    ("cooler", "F"): (34, 44),
+    ("cooler", "C"): (1, 6),
+    ("freezer", "F"): (-8, 5),
+    ("freezer", "C"): (-22, -15),
+}
 
 _LOGGER = logging.getLogger(__name__)
 
-CAPABILITY_TO_NUMBER = {
+# Entries are passed positionally to SmartThingsNumber after the component:
+# attribute, command, name, unit_of_measurement, icon, min_value, max_value, step, mode
+CAPABILITY_TO_NUMBER: dict[str, list[tuple]] = {
     Capability.thermostat_cooling_setpoint: [
-        Map(
+        (
             Attribute.cooling_setpoint,
             "set_cooling_setpoint",
             "Cooling Setpoint",
@@ -46,83 +52,40 @@ CAPABILITY_TO_NUMBER = {
     ],
 }
 
+_NUMBER_CAPABILITIES = frozenset(CAPABILITY_TO_NUMBER)
+
 
 async def async_setup_entry(hass: HomeAssistant, config_entry, async_add_entities):
     """Add numbers for a config entries."""
     broker = hass.data[DOMAIN][DATA_BROKERS][config_entry.entry_id]
     numbers = []
     for device in broker.devices.values():
-        for capability in broker.get_assigned(device.device_id, "number"):
-            _LOGGER.debug(
-                "NB first number capability loop: %s: capability: %s ",
-                device.device_id,
-                capability,
-            )
-
-            maps = CAPABILITY_TO_NUMBER[capability]
-            numbers.extend(
-                [
-                    SmartThingsNumber(
-                        device,
-                        "main",
-                        m.attribute,
-                        m.command,
-                        m.name,
-                        m.unit_of_measurement,
-                        m.icon,
-                        m.min_value,
-                        m.max_value,
-                        m.step,
-                        m.mode,
-                    )
-                    for m in maps
-                ]
-            )
-
-        device_capabilities_for_number = broker.get_assigned(device.device_id, "number")
-
-        for component in device.components:
-            _LOGGER.debug(
-                "NB component loop: %s: %s ",
-                device.device_id,
-                component,
-            )
-            for capability in device.components[component]:
+        assigned = broker.get_assigned(device.device_id, "number")
+        if not assigned:
+            continue
+        # Main capabilities are not part of device.components
+        components = {"main": assigned, **device.components}
+        assigned = set(assigned)
+
+        for component, capabilities in components.items():
+            if _LOGGER.isEnabledFor(logging.DEBUG):
                 _LOGGER.debug(
-                    "NB second number capability loop: %s: %s : %s ",
+                    "NB component loop: %s: %s ",
                     device.device_id,
                     component,
-                    capability,
                 )
-                if capability not in device_capabilities_for_number:
-                    _LOGGER.debug(
-                        "NB capability not found: %s: %s : %s ",
-                        device.device_id,
-                        component,
-                        capability,
-                    )
-                    continue
-
-                maps = CAPABILITY_TO_NUMBER[capability]
-
-                numbers.extend(
-                    [
-                        SmartThingsNumber(
-                            device,
+            for capability in capabilities:
+                if capability not in assigned:
+                    if _LOGGER.isEnabledFor(logging.DEBUG):
+                        _LOGGER.debug(
+                            "NB capability not found: %s: %s : %s ",
+                            device.device_id,
                             component,
-                            m.attribute,
-                            m.command,
-                            m.name,
-                            m.unit_of_measurement,
-                            m.icon,
-                            m.min_value,
-                            m.max_value,
-                            m.step,
-                            m.mode,
+                            capability,
                         )
-                        for m in maps
-                    ]
-                )
+                    continue
+                for m in CAPABILITY_TO_NUMBER[capability]:
+                    numbers.append(SmartThingsNumber(device, component, *m))
 
     async_add_entities(numbers)
 
@@ -136,9 +99,7 @@ def get_capabilities(capabilities: Sequence[str]) -> Sequence[str] | None:
         capabilities,
     )
 
-    return [
-        capability for capability in CAPABILITY_TO_NUMBER if capability in capabilities
-    ]
+    return list(_NUMBER_CAPABILITIES.intersection(capabilities)) or None
 
 
 class SmartThingsNumber(SmartThingsEntity, NumberEntity):
@@ -163,8 +124,19 @@ class SmartThingsNumber(SmartThingsEntity, NumberEntity):
         self._component = component
         self._attribute = attribute
         self._command = command
-        self._name = name
+        if component == "main":
+            self._attr_name = f"{device.label} {name}"
+            self._attr_unique_id = f"{device.device_id}.{attribute}"
+            self._get_attr = lambda: self._device.status.attributes[attribute]
+        else:
+            self._attr_name = f"{device.label} {component} {name}"
+            self._attr_unique_id = f"{device.device_id}.{component}.{attribute}"
+            self._get_attr = lambda: (
+                self._device.status.components[component].attributes[attribute]
+            )
         self._attr_native_unit_of_measurement = unit_of_measurement
+        # Last raw unit reported by the device and the unit it resolved to
+        self._unit_cache = (None, unit_of_measurement)
         self._icon = icon
         self._attr_native_min_value = min_value
         self._attr_native_max_value = max_value
@@ -173,14 +145,15 @@ class SmartThingsNumber(SmartThingsEntity, NumberEntity):
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the number value."""
-        _LOGGER.debug(
-            "NB number set_native_value device: %s component: %s attribute: %s command: %s value: %s ",
-            self._device.device_id,
-            self._component,
-            self._attribute,
-            self._command,
-            value,
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "NB number set_native_value device: %s component: %s attribute: %s command: %s value: %s ",
+                self._device.device_id,
+                self._component,
+                self._attribute,
+                self._command,
+                value,
+            )
         #        await getattr(self._device, self._command)(int(value), set_status=True)
 
         # Defined in device.py async def command(self, component_id: str, capability, command, args=None) -> bool:
@@ -193,42 +166,18 @@ class SmartThingsNumber(SmartThingsEntity, NumberEntity):
 
         self.async_write_ha_state()
 
-    @property
-    def name(self) -> str:
-        """Return the name of the number."""
-        if self._component == "main":
-            return f"{self._device.label} {self._name}"
-        return f"{self._device.label} {self._component} {self._name}"
-
-    @property
-    def unique_id(self) -> str:
-        """Return a unique ID."""
-        if self._component == "main":
-            return f"{self._device.device_id}.{self._attribute}"
-        return f"{self._device.device_id}.{self._component}.{self._attribute}"
-
     @property
     def native_value(self) -> float:
         """Return the state of the sensor."""
-        _LOGGER.debug(
-            "NB Return the state component: %s ",
-            self._component,
-        )
-        if self._component == "main":
-            value = self._device.status.attributes[self._attribute].value
-        else:
-            value = (
-                self._device.status.components[self._component]
-                .attributes[self._attribute]
-                .value
-            )
+        value = self._get_attr().value
 
-        _LOGGER.debug(
-            "NB Number Return the value for component: %s attribute: %s value: %s ",
-            self._component,
-            self._attribute,
-            value,
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "NB Number Return the value for component: %s attribute: %s value: %s ",
+                self._component,
+                self._attribute,
+                value,
+            )
 
         return value
 
@@ -240,58 +189,14 @@ class SmartThingsNumber(SmartThingsEntity, NumberEntity):
     @property
     def native_min_value(self) -> float:
         """Define mimimum level."""
-        # Max and min are hardcoded for Family Hub Fridge/Freezer because the actual ranges are stored in
-        # a separate capability called custom.thermostatSetpointControl instead of where they should be
-        # under temperatureMeasurement -> range
-
-        if self._component == "main":
-            unit = self._device.status.attributes[self._attribute].unit
-        else:
-            unit = (
-                self._device.status.components[self._component]
-                .attributes[self._attribute]
-                .unit
-            )
-        if self._component == "cooler":
-            if unit == "F":
-                return 34
-            elif unit == "C":  # noqa: RET505
-                return 1
-        elif self._component == "freezer":
-            if unit == "F":
-                return -8
-            elif unit == "C":  # noqa: RET505
-                return -22
-
-        return self._attr_native_min_value
+        rng = FRIDGE_RANGES.get((self._component, self._get_attr().unit))
+        return rng[0] if rng else self._attr_native_min_value
 
     @property
     def native_max_value(self) -> float:
         """Define maximum level."""
-        # Max and min are hardcoded for Family Hub Fridge/Freezer because the actual ranges are stored in
-        # a separate capability called custom.thermostatSetpointControl instead of where they should be
-        # under temperatureMeasurement -> range
-
-        if self._component == "main":
-            unit = self._device.status.attributes[self._attribute].unit
-        else:
-            unit = (
-                self._device.status.components[self._component]
-                .attributes[self._attribute]
-                .unit
-            )
-        if self._component == "cooler":
-            if unit == "F":
-                return 44
-            elif unit == "C":  # noqa: RET505
-                return 6
-        elif self._component == "freezer":
-            if unit == "F":
-                return 5
-            elif unit == "C":  # noqa: RET505
-                return -15
-
-        return self._attr_native_max_value
+        rng = FRIDGE_RANGES.get((self._component, self._get_attr().unit))
+        return rng[1] if rng else self._attr_native_max_value
 
     @property
     def native_step(self) -> float:
@@ -301,23 +206,23 @@ class SmartThingsNumber(SmartThingsEntity, NumberEntity):
     @property
     def native_unit_of_measurement(self) -> str | None:
         """Return unit of measurement."""
-        #        unit = self._device.status.attributes[self._attribute].unit
-        if self._component == "main":
-            unit = self._device.status.attributes[self._attribute].unit
-        else:
-            unit = (
-                self._device.status.components[self._component]
-                .attributes[self._attribute]
-                .unit
-            )
+        unit = self._get_attr().unit
+        raw, cached = self._unit_cache
+        if raw == unit:
+            return cached
 
-        _LOGGER.debug(
-            "NB Return the number native_unit_of_measurement: %s : %s : %s ",
-            unit,
-            self._component,
-            self._attr_name,
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "NB Return the number native_unit_of_measurement: %s : %s : %s ",
+                unit,
+                self._component,
+                self._attr_name,
+            )
+        resolved = (
+            UNITS.get(unit, unit) if unit else self._attr_native_unit_of_measurement
         )
-        return UNITS.get(unit, unit) if unit else self._attr_native_unit_of_measurement
+        self._unit_cache = (unit, resolved)
+        return resolved
 
     @property
     def mode(self) -> Literal["auto", "slider", "box"]: